@@ -35,12 +35,12 @@ def demo_prime_numbers():
         print(f"\nFinding primes in range {start}-{end}...")
         print("⏳ Processing...")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = find_primes_in_range(start, end)
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         
         print(f"✅ Found {result['count']} prime numbers")
-        print(f"⏰ Execution time: {result['execution_time']} seconds")
+        print(f"⏰ Execution time: {result['execution_time']:.4f} seconds")
         print(f"📊 First 10 primes: {result['primes'][:10]}")
         if len(result['primes']) > 10:
             print(f"📊 Last 10 primes: {result['primes'][-10:]}")
@@ -56,12 +56,12 @@ def demo_fibonacci():
         print(f"\nCalculating Fibonacci number at position {n}...")
         print("⏳ Processing...")
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = calculate_fibonacci(n)
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         
         print(f"✅ Fibonacci({n}) = {result['fibonacci_number']}")
-        print(f"⏰ Execution time: {result['execution_time']} seconds")
+        print(f"⏰ Execution time: {result['execution_time']:.4f} seconds")
 
 
 def demo_weather():
@@ -79,18 +79,18 @@ def demo_weather():
         return
     
     print("🌍 Fetching weather data for major cities worldwide...")
-    print("⏳ Processing (this may take 10-20 seconds)...")
+    print("⏳ Processing (this may take 1-3 seconds)...")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     result = fetch_weather_for_cities_sync()
-    total_time = time.time() - start_time
+    total_time = time.perf_counter() - start_time
     
     if 'error' in result:
         print(f"❌ Error: {result['error']}")
         return
     
     print(f"✅ Successfully fetched weather for {result['successful_requests']} cities")
-    print(f"⏰ Execution time: {result['execution_time']} seconds")
+    print(f"⏰ Execution time: {result['execution_time']:.4f} seconds")
     
     if result['failed_requests']:
         print(f"⚠️  Failed requests: {len(result['failed_requests'])}")
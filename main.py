@@ -3,8 +3,9 @@ from pydantic import BaseModel
 import redis
 from rq import Queue
 from rq.job import Job
+from rq.serializers import JSONSerializer
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from tasks import find_primes_in_range, calculate_fibonacci, fetch_weather_for_cities_sync
 
 app = FastAPI(
@@ -19,12 +20,17 @@ redis_port = int(os.getenv("REDIS_PORT", 6379))
 
 # Use single Redis connection without decode_responses for RQ compatibility
 redis_conn = redis.Redis(host=redis_host, port=redis_port, decode_responses=False)
-queue = Queue(connection=redis_conn)
+
+# JSON serialization instead of pickle: task args and results are plain
+# JSON-able types, and JSON avoids pickle's per-object framing overhead
+# on large results like prime lists. Must match the worker's serializer.
+queue = Queue(connection=redis_conn, serializer=JSONSerializer)
 
 # Request models
 class PrimeRequest(BaseModel):
     start: int
     end: int
+    return_primes: bool = True
 
 class FibonacciRequest(BaseModel):
     n: int
@@ -41,16 +47,22 @@ class TaskStatusResponse(BaseModel):
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
+class BatchTaskStatusResponse(BaseModel):
+    tasks: List[TaskStatusResponse]
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint that tests Redis connectivity."""
     try:
-        # Test Redis connection
-        redis_conn.ping()
+        # Pipeline the PING and queue-length check into one round-trip
+        with redis_conn.pipeline(transaction=False) as pipe:
+            pipe.ping()
+            pipe.llen(queue.key)
+            _, queue_length = pipe.execute()
         return {
             "status": "healthy",
             "redis_connection": "connected",
-            "queue_length": len(queue)
+            "queue_length": queue_length
         }
     except Exception as e:
         raise HTTPException(
@@ -66,7 +78,10 @@ async def health_check():
 async def enqueue_prime_task(request: PrimeRequest):
     """Enqueue a prime number generation task."""
     try:
-        job = queue.enqueue(find_primes_in_range, request.start, request.end)
+        job = queue.enqueue(
+            find_primes_in_range, request.start, request.end,
+            return_primes=request.return_primes
+        )
         return TaskResponse(
             task_id=job.id,
             status="enqueued",
@@ -101,41 +116,66 @@ async def enqueue_weather_task():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to enqueue task: {str(e)}")
 
+def _task_status(task_id: str, job: Job) -> TaskStatusResponse:
+    """Build a TaskStatusResponse from a fetched RQ job."""
+    if job.is_finished:
+        return TaskStatusResponse(
+            task_id=task_id,
+            status="completed",
+            result=job.result
+        )
+    elif job.is_failed:
+        return TaskStatusResponse(
+            task_id=task_id,
+            status="failed",
+            error=str(job.exc_info) if job.exc_info else "Unknown error"
+        )
+    elif job.is_started:
+        return TaskStatusResponse(
+            task_id=task_id,
+            status="in_progress"
+        )
+    elif job.is_queued:
+        return TaskStatusResponse(
+            task_id=task_id,
+            status="pending"
+        )
+    else:
+        return TaskStatusResponse(
+            task_id=task_id,
+            status="unknown"
+        )
+
+@app.get("/tasks", response_model=BatchTaskStatusResponse)
+async def get_tasks_status(ids: str):
+    """
+    Get the status of multiple tasks in one call, e.g. /tasks?ids=a,b,c.
+    Job.fetch_many pipelines the Redis reads, so N task states cost one
+    round-trip instead of N polling requests.
+    """
+    task_ids = [task_id.strip() for task_id in ids.split(",") if task_id.strip()]
+    if not task_ids:
+        raise HTTPException(status_code=422, detail="No task ids provided")
+    try:
+        jobs = Job.fetch_many(task_ids, connection=redis_conn,
+                              serializer=JSONSerializer)
+        return BatchTaskStatusResponse(tasks=[
+            _task_status(task_id, job) if job is not None
+            else TaskStatusResponse(task_id=task_id, status="not_found")
+            for task_id, job in zip(task_ids, jobs)
+        ])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get task statuses: {str(e)}")
+
 @app.get("/tasks/{task_id}", response_model=TaskStatusResponse)
 async def get_task_status(task_id: str):
     """Get the status and result of a specific task."""
     try:
         # Use RQ's Job class to properly handle serialization
-        job = Job.fetch(task_id, connection=redis_conn)
-        
-        if job.is_finished:
-            return TaskStatusResponse(
-                task_id=task_id,
-                status="completed",
-                result=job.result
-            )
-        elif job.is_failed:
-            return TaskStatusResponse(
-                task_id=task_id,
-                status="failed",
-                error=str(job.exc_info) if job.exc_info else "Unknown error"
-            )
-        elif job.is_started:
-            return TaskStatusResponse(
-                task_id=task_id,
-                status="in_progress"
-            )
-        elif job.is_queued:
-            return TaskStatusResponse(
-                task_id=task_id,
-                status="pending"
-            )
-        else:
-            return TaskStatusResponse(
-                task_id=task_id,
-                status="unknown"
-            )
-            
+        job = Job.fetch(task_id, connection=redis_conn,
+                        serializer=JSONSerializer)
+        return _task_status(task_id, job)
+
     except Exception as e:
         # If job doesn't exist or other error
         if "No such job" in str(e):
@@ -153,7 +193,8 @@ async def root():
             "enqueue_primes": "POST /tasks/primes",
             "enqueue_fibonacci": "POST /tasks/fibonacci", 
             "enqueue_weather": "POST /tasks/weather",
-            "check_task_status": "GET /tasks/{task_id}"
+            "check_task_status": "GET /tasks/{task_id}",
+            "check_tasks_status_batch": "GET /tasks?ids=id1,id2"
         }
     }
 
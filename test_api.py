@@ -4,16 +4,73 @@ Comprehensive test script for FastAPI Redis Queue Background Job Processing Demo
 Tests all API endpoints with various scenarios and validates responses.
 """
 
+import argparse
 import requests
+import io
 import json
 import time
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
 from typing import Dict, Any, Optional
 
+# orjson parses JSON in C and is several times faster than the stdlib on
+# typical payloads; it matters most in the poll loop, which decodes the
+# task-status response on every iteration. Optional: fall back to the
+# stdlib when it's not installed.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Configuration
 BASE_URL = "http://localhost:8000"
 TIMEOUT = 30
 
+# Sentinel meaning "field must exist, any value"
+_EXISTS = object()
+
+# Expected response shapes as (field, expected_value) pairs; values of
+# _EXISTS only require the field's presence
+SCHEMAS = {
+    "root": (
+        ("message", "FastAPI Redis Queue Background Job Processing Demo"),
+        ("docs", _EXISTS),
+        ("health", _EXISTS),
+        ("endpoints", _EXISTS),
+    ),
+    "root_endpoints": (
+        ("enqueue_primes", "POST /tasks/primes"),
+        ("enqueue_fibonacci", "POST /tasks/fibonacci"),
+        ("enqueue_weather", "POST /tasks/weather"),
+        ("check_task_status", "GET /tasks/{task_id}"),
+    ),
+    "health": (
+        ("status", "healthy"),
+        ("redis_connection", "connected"),
+        ("queue_length", _EXISTS),
+    ),
+    "prime_result": (
+        ("primes", _EXISTS),
+        ("count", 168),  # correct count for range 1-1000
+        ("range", "1-1000"),
+        ("execution_time", _EXISTS),
+    ),
+    "fibonacci_result": (
+        ("fibonacci_number", 832040),  # correct value for n=30
+        ("position", 30),
+        ("execution_time", _EXISTS),
+    ),
+    "weather_result": (
+        ("cities_data", _EXISTS),
+        ("successful_requests", _EXISTS),
+        ("failed_requests", _EXISTS),
+        ("total_cities_attempted", 15),
+        ("execution_time", _EXISTS),
+    ),
+}
+
 class Colors:
     GREEN = '\033[92m'
     RED = '\033[91m'
@@ -24,23 +81,60 @@ class Colors:
     BOLD = '\033[1m'
 
 class APITester:
-    def __init__(self, base_url: str = BASE_URL):
+    def __init__(self, base_url: str = BASE_URL, timeout: int = TIMEOUT,
+                 workers: int = 0):
         self.base_url = base_url
+        self.timeout = timeout
+        # 0 means one thread per test (full overlap)
+        self.workers = workers
+        # Endpoint URLs built once here instead of re-concatenated on
+        # every request (the poll loop reuses url_task_prefix per poll)
+        self.url_root = f"{base_url}/"
+        self.url_health = f"{base_url}/health"
+        self.url_primes = f"{base_url}/tasks/primes"
+        self.url_fibonacci = f"{base_url}/tasks/fibonacci"
+        self.url_weather = f"{base_url}/tasks/weather"
+        self.url_task_prefix = f"{base_url}/tasks/"
         self.tests_passed = 0
         self.tests_failed = 0
         self.test_results = []
+        # One session for all requests: keep-alive connections avoid the
+        # per-call TCP handshake, which matters most in the poll loop
+        self.session = requests.Session()
+        self.session.headers.update({"Content-Type": "application/json"})
+        # Guards the shared counters when tests run on worker threads
+        self._record_lock = threading.Lock()
+        # Precompute per-level log prefixes once instead of layering two
+        # f-strings per call; colors are dropped when output is piped so
+        # escape codes don't bloat captured logs
+        self._color = sys.stdout.isatty()
+        if self._color:
+            self._pfx_ok = f"{Colors.GREEN}✅ "
+            self._pfx_err = f"{Colors.RED}❌ "
+            self._pfx_info = f"{Colors.BLUE}ℹ️  "
+            self._suffix = f"{Colors.END}\n"
+        else:
+            self._pfx_ok = "✅ "
+            self._pfx_err = "❌ "
+            self._pfx_info = "ℹ️  "
+            self._suffix = "\n"
+        self._bold = Colors.BOLD if self._color else ""
 
     def log(self, message: str, color: str = Colors.CYAN):
-        print(f"{color}{message}{Colors.END}")
+        if self._color:
+            sys.stdout.write(f"{color}{message}{Colors.END}\n")
+        else:
+            sys.stdout.write(f"{message}\n")
 
     def log_success(self, message: str):
-        self.log(f"✅ {message}", Colors.GREEN)
+        # Single concatenation + write keeps each line atomic across threads
+        sys.stdout.write(self._pfx_ok + message + self._suffix)
 
     def log_error(self, message: str):
-        self.log(f"❌ {message}", Colors.RED)
+        sys.stdout.write(self._pfx_err + message + self._suffix)
 
     def log_info(self, message: str):
-        self.log(f"ℹ️  {message}", Colors.BLUE)
+        sys.stdout.write(self._pfx_info + message + self._suffix)
 
     def assert_status_code(self, response: requests.Response, expected: int, test_name: str):
         """Assert HTTP status code matches expected value."""
@@ -61,30 +155,48 @@ class APITester:
             self.log_error(f"{test_name}: Field '{field}' expected '{expected_value}', got '{actual_value}'")
             return False
 
-    def assert_json_field_exists(self, data: Dict[str, Any], field: str, test_name: str):
-        """Assert JSON field exists."""
-        if field in data:
-            self.log_success(f"{test_name}: Field '{field}' exists")
-            return True
-        else:
-            self.log_error(f"{test_name}: Field '{field}' missing")
-            return False
+    def validate(self, data: Dict[str, Any], spec, test_name: str) -> bool:
+        """
+        Validate data against a spec of (field, expected) pairs in a
+        single pass, short-circuiting on the first failure. A passing
+        spec emits one summary line instead of a line per field.
+        """
+        _MISS = object()
+        for field, expected in spec:
+            actual = data.get(field, _MISS)
+            if actual is _MISS:
+                self.log_error(f"{test_name}: Field '{field}' missing")
+                return False
+            if expected is not _EXISTS and actual != expected:
+                self.log_error(f"{test_name}: Field '{field}' expected '{expected}', got '{actual}'")
+                return False
+        self.log_success(f"{test_name}: {len(spec)} field checks passed")
+        return True
 
-    def wait_for_task_completion(self, task_id: str, timeout: int = TIMEOUT) -> Optional[Dict[str, Any]]:
+    def wait_for_task_completion(self, task_id: str, timeout: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """Wait for a task to complete and return the result."""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
+        if timeout is None:
+            timeout = self.timeout
+        # Build the URL once and compare against a fixed monotonic
+        # deadline so the hot loop does no formatting or wall-clock reads
+        url = self.url_task_prefix + task_id
+        deadline = time.monotonic() + timeout
+        # Exponential backoff: quick tasks are detected within tens of
+        # milliseconds while long tasks aren't hammered with polls
+        delay = 0.05
+        while time.monotonic() < deadline:
             try:
-                response = requests.get(f"{self.base_url}/tasks/{task_id}")
+                response = self.session.get(url)
                 if response.status_code == 200:
-                    data = response.json()
+                    data = _json_loads(response.content)
                     if data.get('status') in ['completed', 'failed']:
                         return data
-                time.sleep(1)
+                time.sleep(delay)
+                delay = min(delay * 1.5, 2.0)
             except Exception as e:
                 self.log_error(f"Error checking task status: {e}")
                 return None
-        
+
         self.log_error(f"Task {task_id} did not complete within {timeout} seconds")
         return None
 
@@ -93,27 +205,21 @@ class APITester:
         self.log_info("Testing root endpoint (GET /)")
         
         try:
-            response = requests.get(f"{self.base_url}/")
+            response = self.session.get(self.url_root)
             success = True
             
             # Check status code
             success &= self.assert_status_code(response, 200, "Root endpoint")
             
             # Check response structure
-            data = response.json()
-            success &= self.assert_json_field(data, "message", "FastAPI Redis Queue Background Job Processing Demo", "Root endpoint")
-            success &= self.assert_json_field_exists(data, "docs", "Root endpoint")
-            success &= self.assert_json_field_exists(data, "health", "Root endpoint")
-            success &= self.assert_json_field_exists(data, "endpoints", "Root endpoint")
-            
-            # Check endpoints structure
-            if "endpoints" in data:
-                endpoints = data["endpoints"]
-                success &= self.assert_json_field(endpoints, "enqueue_primes", "POST /tasks/primes", "Root endpoint")
-                success &= self.assert_json_field(endpoints, "enqueue_fibonacci", "POST /tasks/fibonacci", "Root endpoint")
-                success &= self.assert_json_field(endpoints, "enqueue_weather", "POST /tasks/weather", "Root endpoint")
-                success &= self.assert_json_field(endpoints, "check_task_status", "GET /tasks/{task_id}", "Root endpoint")
-            
+            data = _json_loads(response.content)
+            success &= self.validate(data, SCHEMAS["root"], "Root endpoint")
+
+            # Check endpoints structure (single lookup, reused below)
+            endpoints = data.get("endpoints")
+            if endpoints is not None:
+                success &= self.validate(endpoints, SCHEMAS["root_endpoints"], "Root endpoint")
+
             self.record_test("Root Endpoint", success)
             
         except Exception as e:
@@ -125,18 +231,16 @@ class APITester:
         self.log_info("Testing health endpoint (GET /health)")
         
         try:
-            response = requests.get(f"{self.base_url}/health")
+            response = self.session.get(self.url_health)
             success = True
             
             # Check status code
             success &= self.assert_status_code(response, 200, "Health endpoint")
             
             # Check response structure
-            data = response.json()
-            success &= self.assert_json_field(data, "status", "healthy", "Health endpoint")
-            success &= self.assert_json_field(data, "redis_connection", "connected", "Health endpoint")
-            success &= self.assert_json_field_exists(data, "queue_length", "Health endpoint")
-            
+            data = _json_loads(response.content)
+            success &= self.validate(data, SCHEMAS["health"], "Health endpoint")
+
             self.record_test("Health Endpoint", success)
             
         except Exception as e:
@@ -150,10 +254,9 @@ class APITester:
         try:
             # Test parameters used in manual testing
             payload = {"start": 1, "end": 1000}
-            response = requests.post(
-                f"{self.base_url}/tasks/primes",
-                json=payload,
-                headers={"Content-Type": "application/json"}
+            response = self.session.post(
+                self.url_primes,
+                json=payload
             )
             
             success = True
@@ -162,31 +265,29 @@ class APITester:
             success &= self.assert_status_code(response, 200, "Prime task creation")
             
             # Check response structure
-            data = response.json()
-            success &= self.assert_json_field_exists(data, "task_id", "Prime task creation")
-            success &= self.assert_json_field(data, "status", "enqueued", "Prime task creation")
-            success &= self.assert_json_field(data, "message", "Prime generation task enqueued for range 1-1000", "Prime task creation")
-            
-            if success and "task_id" in data:
-                task_id = data["task_id"]
+            data = _json_loads(response.content)
+            success &= self.validate(data, (
+                ("task_id", _EXISTS),
+                ("status", "enqueued"),
+                ("message", "Prime generation task enqueued for range 1-1000"),
+            ), "Prime task creation")
+
+            task_id = data.get("task_id")
+            if success and task_id:
                 self.log_info(f"Waiting for prime task {task_id} to complete...")
-                
+
                 # Wait for task completion
                 task_result = self.wait_for_task_completion(task_id)
                 if task_result:
-                    success &= self.assert_json_field(task_result, "status", "completed", "Prime task completion")
-                    success &= self.assert_json_field_exists(task_result, "result", "Prime task completion")
-                    
-                    if "result" in task_result:
-                        result = task_result["result"]
-                        success &= self.assert_json_field_exists(result, "primes", "Prime task result")
-                        success &= self.assert_json_field_exists(result, "count", "Prime task result")
-                        success &= self.assert_json_field(result, "range", "1-1000", "Prime task result")
-                        success &= self.assert_json_field_exists(result, "execution_time", "Prime task result")
-                        
-                        # Check that we got 168 primes (correct count for 1-1000)
-                        if "count" in result:
-                            success &= self.assert_json_field(result, "count", 168, "Prime task result count")
+                    success &= self.validate(task_result, (
+                        ("status", "completed"),
+                        ("result", _EXISTS),
+                    ), "Prime task completion")
+
+                    # Hoist the nested result block to one lookup
+                    result = task_result.get("result")
+                    if result is not None:
+                        success &= self.validate(result, SCHEMAS["prime_result"], "Prime task result")
                 else:
                     success = False
             
@@ -203,10 +304,9 @@ class APITester:
         try:
             # Test parameters used in manual testing
             payload = {"n": 30}
-            response = requests.post(
-                f"{self.base_url}/tasks/fibonacci",
-                json=payload,
-                headers={"Content-Type": "application/json"}
+            response = self.session.post(
+                self.url_fibonacci,
+                json=payload
             )
             
             success = True
@@ -215,30 +315,29 @@ class APITester:
             success &= self.assert_status_code(response, 200, "Fibonacci task creation")
             
             # Check response structure
-            data = response.json()
-            success &= self.assert_json_field_exists(data, "task_id", "Fibonacci task creation")
-            success &= self.assert_json_field(data, "status", "enqueued", "Fibonacci task creation")
-            success &= self.assert_json_field(data, "message", "Fibonacci calculation task enqueued for n=30", "Fibonacci task creation")
-            
-            if success and "task_id" in data:
-                task_id = data["task_id"]
+            data = _json_loads(response.content)
+            success &= self.validate(data, (
+                ("task_id", _EXISTS),
+                ("status", "enqueued"),
+                ("message", "Fibonacci calculation task enqueued for n=30"),
+            ), "Fibonacci task creation")
+
+            task_id = data.get("task_id")
+            if success and task_id:
                 self.log_info(f"Waiting for Fibonacci task {task_id} to complete...")
-                
+
                 # Wait for task completion
                 task_result = self.wait_for_task_completion(task_id)
                 if task_result:
-                    success &= self.assert_json_field(task_result, "status", "completed", "Fibonacci task completion")
-                    success &= self.assert_json_field_exists(task_result, "result", "Fibonacci task completion")
-                    
-                    if "result" in task_result:
-                        result = task_result["result"]
-                        success &= self.assert_json_field_exists(result, "fibonacci_number", "Fibonacci task result")
-                        success &= self.assert_json_field(result, "position", 30, "Fibonacci task result")
-                        success &= self.assert_json_field_exists(result, "execution_time", "Fibonacci task result")
-                        
-                        # Check that we got the correct Fibonacci number for n=30 (832040)
-                        if "fibonacci_number" in result:
-                            success &= self.assert_json_field(result, "fibonacci_number", 832040, "Fibonacci task result number")
+                    success &= self.validate(task_result, (
+                        ("status", "completed"),
+                        ("result", _EXISTS),
+                    ), "Fibonacci task completion")
+
+                    # Hoist the nested result block to one lookup
+                    result = task_result.get("result")
+                    if result is not None:
+                        success &= self.validate(result, SCHEMAS["fibonacci_result"], "Fibonacci task result")
                 else:
                     success = False
             
@@ -253,10 +352,7 @@ class APITester:
         self.log_info("Testing weather task endpoint (POST /tasks/weather)")
         
         try:
-            response = requests.post(
-                f"{self.base_url}/tasks/weather",
-                headers={"Content-Type": "application/json"}
-            )
+            response = self.session.post(self.url_weather)
             
             success = True
             
@@ -264,32 +360,29 @@ class APITester:
             success &= self.assert_status_code(response, 200, "Weather task creation")
             
             # Check response structure
-            data = response.json()
-            success &= self.assert_json_field_exists(data, "task_id", "Weather task creation")
-            success &= self.assert_json_field(data, "status", "enqueued", "Weather task creation")
-            success &= self.assert_json_field(data, "message", "Weather data fetching task enqueued", "Weather task creation")
-            
-            if success and "task_id" in data:
-                task_id = data["task_id"]
+            data = _json_loads(response.content)
+            success &= self.validate(data, (
+                ("task_id", _EXISTS),
+                ("status", "enqueued"),
+                ("message", "Weather data fetching task enqueued"),
+            ), "Weather task creation")
+
+            task_id = data.get("task_id")
+            if success and task_id:
                 self.log_info(f"Waiting for weather task {task_id} to complete...")
-                
+
                 # Wait for task completion
                 task_result = self.wait_for_task_completion(task_id)
                 if task_result:
-                    success &= self.assert_json_field(task_result, "status", "completed", "Weather task completion")
-                    success &= self.assert_json_field_exists(task_result, "result", "Weather task completion")
-                    
-                    if "result" in task_result:
-                        result = task_result["result"]
-                        success &= self.assert_json_field_exists(result, "cities_data", "Weather task result")
-                        success &= self.assert_json_field_exists(result, "successful_requests", "Weather task result")
-                        success &= self.assert_json_field_exists(result, "failed_requests", "Weather task result")
-                        success &= self.assert_json_field_exists(result, "total_cities_attempted", "Weather task result")
-                        success &= self.assert_json_field_exists(result, "execution_time", "Weather task result")
-                        
-                        # Check that we attempted 15 cities
-                        if "total_cities_attempted" in result:
-                            success &= self.assert_json_field(result, "total_cities_attempted", 15, "Weather task cities count")
+                    success &= self.validate(task_result, (
+                        ("status", "completed"),
+                        ("result", _EXISTS),
+                    ), "Weather task completion")
+
+                    # Hoist the nested result block to one lookup
+                    result = task_result.get("result")
+                    if result is not None:
+                        success &= self.validate(result, SCHEMAS["weather_result"], "Weather task result")
                 else:
                     success = False
             
@@ -305,13 +398,13 @@ class APITester:
         
         try:
             # Test with non-existent task ID
-            response = requests.get(f"{self.base_url}/tasks/nonexistent-task-id")
+            response = self.session.get(self.url_task_prefix + "nonexistent-task-id")
             success = True
             
             # Should return 404 for non-existent task
             success &= self.assert_status_code(response, 404, "Task status (non-existent)")
             
-            data = response.json()
+            data = _json_loads(response.content)
             success &= self.assert_json_field(data, "detail", "Task not found", "Task status (non-existent)")
             
             self.record_test("Task Status Endpoint", success)
@@ -328,18 +421,16 @@ class APITester:
         
         try:
             # Test prime task with invalid data
-            response = requests.post(
-                f"{self.base_url}/tasks/primes",
-                json={"start": "invalid", "end": 100},
-                headers={"Content-Type": "application/json"}
+            response = self.session.post(
+                self.url_primes,
+                json={"start": "invalid", "end": 100}
             )
             success &= self.assert_status_code(response, 422, "Prime task (invalid data)")
             
             # Test Fibonacci task with missing data
-            response = requests.post(
-                f"{self.base_url}/tasks/fibonacci",
-                json={},
-                headers={"Content-Type": "application/json"}
+            response = self.session.post(
+                self.url_fibonacci,
+                json={}
             )
             success &= self.assert_status_code(response, 422, "Fibonacci task (missing data)")
             
@@ -351,82 +442,109 @@ class APITester:
 
     def record_test(self, test_name: str, passed: bool):
         """Record test result."""
-        if passed:
-            self.tests_passed += 1
-            self.log_success(f"{test_name}: PASSED")
-        else:
-            self.tests_failed += 1
-            self.log_error(f"{test_name}: FAILED")
-        
-        self.test_results.append({"name": test_name, "passed": passed})
+        with self._record_lock:
+            if passed:
+                self.tests_passed += 1
+                self.log_success(f"{test_name}: PASSED")
+            else:
+                self.tests_failed += 1
+                self.log_error(f"{test_name}: FAILED")
+
+            self.test_results.append({"name": test_name, "passed": passed})
 
     def run_all_tests(self):
         """Run all tests."""
-        self.log(f"{Colors.BOLD}🚀 Starting FastAPI Redis Queue API Tests{Colors.END}")
-        self.log(f"{Colors.BOLD}Base URL: {self.base_url}{Colors.END}")
+        self.log(f"{self._bold}🚀 Starting FastAPI Redis Queue API Tests")
+        self.log(f"{self._bold}Base URL: {self.base_url}")
         print()
         
-        # Run all test methods
-        self.test_root_endpoint()
+        # All tests are independent of each other (record_test guards the
+        # shared counters), so run them in parallel: the tests are I/O-bound
+        # on HTTP round-trips and task latency, and overlapping them makes
+        # total wall time the slowest test instead of the sum of all seven
+        tests = [
+            self.test_root_endpoint,
+            self.test_health_endpoint,
+            self.test_prime_task_endpoint,
+            self.test_fibonacci_task_endpoint,
+            self.test_weather_task_endpoint,
+            self.test_task_status_endpoint,
+            self.test_error_cases,
+        ]
+        with ThreadPoolExecutor(max_workers=self.workers or len(tests)) as executor:
+            futures = [executor.submit(test) for test in tests]
+            wait(futures, return_when=FIRST_EXCEPTION)
+            # Surface any exception a test thread raised
+            for future in futures:
+                future.result()
         print()
-        
-        self.test_health_endpoint()
-        print()
-        
-        self.test_prime_task_endpoint()
-        print()
-        
-        self.test_fibonacci_task_endpoint()
-        print()
-        
-        self.test_weather_task_endpoint()
-        print()
-        
-        self.test_task_status_endpoint()
-        print()
-        
-        self.test_error_cases()
-        print()
-        
-        # Print summary
-        self.print_summary()
+
+        # Print summary (executor is shut down by the with-block, so all
+        # results are recorded by now)
+        return self.print_summary()
 
     def print_summary(self):
         """Print test summary."""
         total_tests = self.tests_passed + self.tests_failed
-        
-        print("=" * 60)
-        self.log(f"{Colors.BOLD}📊 TEST SUMMARY{Colors.END}")
-        print("=" * 60)
-        
-        self.log(f"Total Tests: {total_tests}", Colors.CYAN)
-        self.log(f"Passed: {self.tests_passed}", Colors.GREEN)
-        self.log(f"Failed: {self.tests_failed}", Colors.RED)
-        
+
+        # Accumulate the whole summary and emit it with one write so the
+        # terminal paints it in a single block instead of ~10+N flushes
+        buf = io.StringIO()
+
+        def line(message: str, color: str = Colors.CYAN):
+            if self._color:
+                buf.write(f"{color}{message}{Colors.END}\n")
+            else:
+                buf.write(f"{message}\n")
+
+        buf.write("=" * 60 + "\n")
+        line(f"{self._bold}📊 TEST SUMMARY")
+        buf.write("=" * 60 + "\n")
+
+        line(f"Total Tests: {total_tests}")
+        line(f"Passed: {self.tests_passed}", Colors.GREEN)
+        line(f"Failed: {self.tests_failed}", Colors.RED)
+
         if self.tests_failed == 0:
-            self.log(f"{Colors.BOLD}🎉 ALL TESTS PASSED!{Colors.END}", Colors.GREEN)
+            line(f"{self._bold}🎉 ALL TESTS PASSED!", Colors.GREEN)
         else:
-            self.log(f"{Colors.BOLD}⚠️  {self.tests_failed} TEST(S) FAILED{Colors.END}", Colors.RED)
-        
-        print()
-        self.log("Test Results:", Colors.CYAN)
+            line(f"{self._bold}⚠️  {self.tests_failed} TEST(S) FAILED", Colors.RED)
+
+        buf.write("\n")
+        line("Test Results:")
         for result in self.test_results:
             status = "✅ PASS" if result["passed"] else "❌ FAIL"
             color = Colors.GREEN if result["passed"] else Colors.RED
-            self.log(f"  {result['name']}: {status}", color)
-        
-        print("=" * 60)
-        
+            line(f"  {result['name']}: {status}", color)
+
+        buf.write("=" * 60 + "\n")
+
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
         return self.tests_failed == 0
 
 def main():
     """Main function."""
-    if len(sys.argv) > 1:
-        base_url = sys.argv[1]
-    else:
-        base_url = BASE_URL
-    
-    tester = APITester(base_url)
+    parser = argparse.ArgumentParser(
+        description="API test suite for the FastAPI Redis Queue demo."
+    )
+    # Positional form kept for backwards compatibility with
+    # `python test_api.py http://localhost:8000`
+    parser.add_argument("base_url", nargs="?", default=None,
+                        help="base URL of the API (same as --base-url)")
+    parser.add_argument("--base-url", dest="base_url_opt", default=BASE_URL,
+                        help=f"base URL of the API (default: {BASE_URL})")
+    parser.add_argument("--timeout", type=int, default=TIMEOUT,
+                        help="seconds to wait for each task to complete "
+                             f"(default: {TIMEOUT})")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="test threads to run concurrently "
+                             "(default: one per test)")
+    args = parser.parse_args()
+
+    tester = APITester(args.base_url or args.base_url_opt,
+                       timeout=args.timeout, workers=args.workers)
     
     try:
         success = tester.run_all_tests()
@@ -437,6 +555,8 @@ def main():
     except Exception as e:
         print(f"\n\n❌ Tests failed with error: {e}")
         sys.exit(1)
+    finally:
+        tester.session.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 """
 Redis Queue Worker for background task processing.
-This script creates and runs an RQ worker to process jobs from the Redis queue.
+This script creates and runs RQ workers to process jobs from the Redis queue.
 """
 
 import os
 import sys
+import signal
+import multiprocessing
 import redis
-from rq import Worker, Queue
+from rq import SimpleWorker, Worker, Queue
+from rq.serializers import JSONSerializer
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -17,45 +20,140 @@ load_dotenv()
 from tasks import (
     find_primes_in_range,
     calculate_fibonacci,
-    fetch_weather_for_cities_sync
+    fetch_weather_for_cities_sync,
+    shutdown_async_resources
 )
 
+def _connect(redis_host: str, redis_port: int) -> redis.Redis:
+    """Create a pooled Redis connection configured for RQ (binary-safe).
+
+    An explicit BlockingConnectionPool bounds the connection count and
+    makes callers wait for a free connection instead of erroring when RQ
+    fans out scheduler and heartbeat writes. TCP keepalive stops idle
+    BRPOP connections from being dropped by NAT/firewall timeouts
+    (redis-py already sets TCP_NODELAY on every connection) and makes
+    an application-level health_check_interval PING redundant.
+    """
+    # No socket_timeout here: RQ's dequeue is a long BLPOP and a read
+    # timeout shorter than its blocking window would kill the wait
+    # mid-block. Connection establishment is bounded instead.
+    pool = redis.BlockingConnectionPool(
+        host=redis_host,
+        port=redis_port,
+        max_connections=32,
+        socket_keepalive=True,
+        socket_connect_timeout=2,
+        decode_responses=False
+    )
+    return redis.Redis(connection_pool=pool)
+
+def _run_worker(redis_host: str, redis_port: int, with_scheduler: bool,
+                worker_cls=SimpleWorker):
+    """Run a single RQ worker until interrupted.
+
+    Used both inline (single-worker mode) and as the target of each
+    worker process in multi-worker mode; every process gets its own
+    Redis connection since connections can't be shared across forks.
+    """
+    redis_conn = _connect(redis_host, redis_port)
+    queue = Queue(connection=redis_conn, serializer=JSONSerializer)
+    worker = worker_cls([queue], connection=redis_conn,
+                        serializer=JSONSerializer)
+    try:
+        worker.work(with_scheduler=with_scheduler)
+    finally:
+        # Release the shared aiohttp session and event loop
+        shutdown_async_resources()
+
 def main():
-    """Start the RQ worker."""
+    """Start the RQ worker processes."""
     # Redis connection configuration
     redis_host = os.getenv("REDIS_HOST", "localhost")
     redis_port = int(os.getenv("REDIS_PORT", 6379))
-    
+
+    # One worker per core by default: independent CPU-bound jobs (primes,
+    # Fibonacci) then execute on independent cores instead of queueing
+    # behind a single worker
+    num_workers = int(os.getenv("WORKER_COUNT", os.cpu_count() or 1))
+
+    # SimpleWorker runs jobs in the worker process itself instead of
+    # forking a subprocess per job. The task modules are already imported
+    # above, so small jobs like calculate_fibonacci(30) skip fork plus
+    # interpreter re-import, which otherwise dwarfs their actual compute.
+    # Pass --forked to restore the per-job fork (isolates jobs that leak
+    # memory or crash).
+    worker_cls = Worker if "--forked" in sys.argv[1:] else SimpleWorker
+
+    # The scheduler thread only matters for enqueue_in/enqueue_at jobs,
+    # which nothing in this demo uses; left on it just wakes periodically
+    # to scan an empty schedule. Set RQ_SCHEDULER=1 if scheduled enqueues
+    # are ever added.
+    run_scheduler = os.getenv("RQ_SCHEDULER", "0") == "1"
+
     print(f"Connecting to Redis at {redis_host}:{redis_port}")
-    
+
     try:
-        # Create Redis connection (no decode_responses for RQ binary data)
-        redis_conn = redis.Redis(
-            host=redis_host, 
-            port=redis_port, 
-            decode_responses=False,
-            health_check_interval=30
-        )
-        
-        # Test the connection
+        # Test the connection before spawning anything
+        redis_conn = _connect(redis_host, redis_port)
         redis_conn.ping()
         print("✅ Redis connection successful")
-        
-        # Create queue
-        queue = Queue(connection=redis_conn)
-        
+
+        # Warm up the task code paths once in the parent: tiny calls force
+        # NumPy's sieve machinery and the Fibonacci cache to initialize
+        # here, so the first real job doesn't pay that one-time cost and
+        # forked worker processes inherit the warm state via copy-on-write.
+        # Set WARMUP=0 to skip.
+        if os.getenv("WARMUP", "1") != "0":
+            find_primes_in_range(2, 3)
+            calculate_fibonacci(2)
+
+        queue = Queue(connection=redis_conn, serializer=JSONSerializer)
         print(f"📋 Queue length: {len(queue)}")
-        print("🚀 Starting RQ worker...")
+        print(f"🚀 Starting {num_workers} RQ worker(s)...")
         print("📝 Available tasks:")
         print("   - find_primes_in_range")
-        print("   - calculate_fibonacci") 
+        print("   - calculate_fibonacci")
         print("   - fetch_weather_for_cities_sync")
         print("\n⏳ Waiting for jobs... (Press Ctrl+C to exit)")
-        
-        # Start the worker
-        worker = Worker([queue], connection=redis_conn)
-        worker.work(with_scheduler=True)
-            
+
+        if num_workers <= 1:
+            _run_worker(redis_host, redis_port, with_scheduler=run_scheduler,
+                        worker_cls=worker_cls)
+            return
+
+        # Fan out one worker process per core. At most the first runs the
+        # scheduler: scheduled-job polling needs exactly one scheduler
+        # and extra ones just add Redis chatter.
+        procs = [
+            multiprocessing.Process(
+                target=_run_worker,
+                args=(redis_host, redis_port,
+                      run_scheduler and i == 0, worker_cls),
+                name=f"rq-worker-{i}"
+            )
+            for i in range(num_workers)
+        ]
+        for proc in procs:
+            proc.start()
+
+        # Forward SIGTERM (e.g. from docker stop) to the children so the
+        # whole pool shuts down together
+        def _terminate_children(signum, frame):
+            for proc in procs:
+                proc.terminate()
+
+        signal.signal(signal.SIGTERM, _terminate_children)
+
+        try:
+            for proc in procs:
+                proc.join()
+        except KeyboardInterrupt:
+            # Ctrl+C reaches the children too (same process group); just
+            # wait for them to finish shutting down
+            for proc in procs:
+                proc.join()
+            raise
+
     except redis.ConnectionError as e:
         print(f"❌ Redis connection failed: {e}")
         print("Make sure Redis server is running and accessible.")
@@ -68,4 +166,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()